@@ -18,12 +18,13 @@ import os
 import logging
 
 from blinker import signal
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from itertools import chain, groupby
 from operator import attrgetter
 
 import pelican.contents as contents
+from pelican.cache import FileStampDataCacher
 from pelican.utils import process_translations
 
 from pelican import signals, generators, get_plugin_name
@@ -55,22 +56,27 @@ def get_generators(pelican_object):
 
 
 def extract_summaries_from_entities(generators):
-    for plugin in pelican.plugins:
-        plugin_name = get_plugin_name(plugin)
-        if plugin_name == "summary":
-            logger.debug("Summarizing entities")
-            for generator in generators:
-                if isinstance(generator, EntityGenerator):
-                    for entity in generator.entities:
-                        logger.debug("Summarizing entity '%s'\n", entity.title)
-                        try:
-                            plugin.extract_summary(entity)
-                        except Exception as e:
-                            logger.error(
-                                "Error summarizing entity '%s'\n",
-                                entity.title,
-                                exc_info=e,
-                            )
+    summary_plugin = next(
+        (plugin for plugin in pelican.plugins if get_plugin_name(plugin) == "summary"),
+        None,
+    )
+    if summary_plugin is None:
+        return
+
+    logger.debug("Summarizing entities")
+    extract_summary = summary_plugin.extract_summary
+    for generator in generators:
+        if isinstance(generator, EntityGenerator):
+            for entity in generator.entities:
+                logger.debug("Summarizing entity '%s'\n", entity.title)
+                try:
+                    extract_summary(entity)
+                except Exception as e:
+                    logger.error(
+                        "Error summarizing entity '%s'\n",
+                        entity.title,
+                        exc_info=e,
+                    )
 
 
 def register():
@@ -78,8 +84,14 @@ def register():
     signals.all_generators_finalized.connect(extract_summaries_from_entities)
 
 
+def _sort_with_key(key, reverse, objects):
+    objects.sort(key=key, reverse=reverse)
+
+
 def attribute_list_sorter(attr_list, reverse=False):
-    return lambda objects: objects.sort(key=attrgetter(*attr_list), reverse=reverse)
+    # Settings end up pickled along with cached content, so return a partial
+    # of a module-level function rather than a (non-picklable) lambda.
+    return partial(_sort_with_key, attrgetter(*attr_list), reverse)
 
 
 def get_default_entity_type_settings(entity_type):
@@ -108,29 +120,23 @@ def get_default_entity_type_settings(entity_type):
     settings["SORTER"] = attribute_list_sorter(["date"], True)
 
     settings[entity_type_upper + "_URL"] = entity_type_lower + "/{slug}.html"
-    settings[entity_type_upper + "_SAVE_AS"] = os.path.join(
-        entity_type_lower, "{slug}.html"
-    )
+    settings[entity_type_upper + "_SAVE_AS"] = entity_type_lower + "/{slug}.html"
     settings[entity_type_upper + "_LANG_URL"] = (
         entity_type_lower + "/{slug}-{lang}.html"
     )
-    settings[entity_type_upper + "_LANG_SAVE_AS"] = os.path.join(
-        entity_type_lower, "{slug}-{lang}.html"
+    settings[entity_type_upper + "_LANG_SAVE_AS"] = (
+        entity_type_lower + "/{slug}-{lang}.html"
     )
     # settings['ARCHIVE_TEMPLATE'] = 'archive'
     # settings['CATEGORY_TEMPLATE'] = 'category'
     settings["CATEGORY_URL"] = entity_type_lower + "/category/{slug}.html"
-    settings["CATEGORY_SAVE_AS"] = os.path.join(
-        entity_type_lower, "category", "{slug}.html"
-    )
+    settings["CATEGORY_SAVE_AS"] = entity_type_lower + "/category/{slug}.html"
     # settings['TAG_TEMPLATE'] = 'tag'
     settings["TAG_URL"] = entity_type_lower + "/tag/{slug}.html"
-    settings["TAG_SAVE_AS"] = os.path.join(entity_type_lower, "tag", "{slug}.html")
+    settings["TAG_SAVE_AS"] = entity_type_lower + "/tag/{slug}.html"
     # settings['AUTHOR_TEMPLATE'] = 'author'
     settings["AUTHOR_URL"] = entity_type_lower + "/author/{slug}.html"
-    settings["AUTHOR_SAVE_AS"] = os.path.join(
-        entity_type_lower, "author", "{slug}.html"
-    )
+    settings["AUTHOR_SAVE_AS"] = entity_type_lower + "/author/{slug}.html"
 
     settings["DIRECT_TEMPLATES"] = []
     settings["PAGINATED_TEMPLATES"] = {}
@@ -139,21 +145,46 @@ def get_default_entity_type_settings(entity_type):
 
 
 class Entity(contents.Page):
-    pass
+    def __reduce__(self):
+        # Entity classes are created on the fly by EntityFactory and can't be
+        # looked up by name, so pickle (e.g. for content caching) the factory
+        # arguments instead and rebuild the class when loading.
+        cls = self.__class__
+        factory_args = (
+            cls.type,
+            sorted(cls.mandatory_properties),
+            cls.default_template,
+            cls.__bases__[0],
+        )
+        return (_unpickle_entity, factory_args, self.__dict__)
+
+
+def _unpickle_entity(name, mandatory_properties, default_template, BaseClass):
+    entity_class = EntityFactory(
+        name, mandatory_properties, default_template, BaseClass
+    )
+    return entity_class.__new__(entity_class)
+
+
+_entity_classes = {}
 
 
 def EntityFactory(name, mandatory_properties, default_template, BaseClass=Entity):
     base_mandatory_properties = ["title"]
     mandatory_properties = set(base_mandatory_properties + mandatory_properties)
-    newclass = type(
-        str(name),
-        (BaseClass,),
-        {
-            "type": name,
-            "mandatory_properties": mandatory_properties,
-            "default_template": default_template,
-        },
-    )
+    key = (name, frozenset(mandatory_properties), default_template, BaseClass)
+    newclass = _entity_classes.get(key)
+    if newclass is None:
+        newclass = type(
+            str(name),
+            (BaseClass,),
+            {
+                "type": name,
+                "mandatory_properties": mandatory_properties,
+                "default_template": default_template,
+            },
+        )
+        _entity_classes[key] = newclass
     return newclass
 
 
@@ -168,182 +199,258 @@ class EntityGenerator(generators.Generator):
             self.entity_type = entity_type
             self.entities = []  # only entities in default language
             self.translations = []
-            self.tags = defaultdict(list)
-            self.categories = defaultdict(list)
-            self.authors = defaultdict(list)
+            self.tags = {}
+            self.categories = {}
+            self.authors = {}
             self.drafts = []  # only drafts in default language
             self.drafts_translations = []
-            self.sort_attrs = []
-            super().__init__(*args, cache_name=entity_type, **kwargs)
+            self.sort_attrs = ["date"]  # ordering of the FEED_ALL_* feeds
+
+            # Mirrors CachingGenerator.__init__ but keys both the generator
+            # and the readers caches by entity type. Otherwise every entity
+            # type shares (and overwrites) the same cache files, so unchanged
+            # sources of all but the last type get re-read on every run.
+            cache_name = "{0}-{1}".format(self.__class__.__name__, entity_type)
+            generators.Generator.__init__(
+                self,
+                *args,
+                readers_cache_name=cache_name + "-Readers",
+                cache_name=entity_type,
+                **kwargs,
+            )
+
+            cache_this_level = self.settings["CONTENT_CACHING_LAYER"] == "generator"
+            caching_policy = cache_this_level and self.settings["CACHE_CONTENT"]
+            load_policy = cache_this_level and self.settings["LOAD_CONTENT_CACHE"]
+            FileStampDataCacher.__init__(
+                self, self.settings, cache_name, caching_policy, load_policy
+            )
             entity_subgenerator_init.send(self)
 
+        def get_cached_data(self, filename, default=None):
+            """Get the cached entity for the given file if it's unmodified.
+
+            Files without a cache entry (all of them when caching is off) are
+            not stamped, sparing a stat or a full read and hash per file.
+            """
+            if filename not in self._cache:
+                return default
+            return super().get_cached_data(filename, default)
+
         def generate_feeds(self, writer):
             """Generate the feeds from the current context, and output files."""
 
-            if self.settings.get("FEED_ATOM"):
+            feed_atom = self.settings.get("FEED_ATOM")
+            feed_rss = self.settings.get("FEED_RSS")
+            feed_all_atom = self.settings.get("FEED_ALL_ATOM")
+            feed_all_rss = self.settings.get("FEED_ALL_RSS")
+            category_feed_atom = self.settings.get("CATEGORY_FEED_ATOM")
+            category_feed_rss = self.settings.get("CATEGORY_FEED_RSS")
+            author_feed_atom = self.settings.get("AUTHOR_FEED_ATOM")
+            author_feed_rss = self.settings.get("AUTHOR_FEED_RSS")
+            tag_feed_atom = self.settings.get("TAG_FEED_ATOM")
+            tag_feed_rss = self.settings.get("TAG_FEED_RSS")
+            translation_feed_atom = self.settings.get("TRANSLATION_FEED_ATOM")
+            translation_feed_rss = self.settings.get("TRANSLATION_FEED_RSS")
+
+            if not any(
+                (
+                    feed_atom,
+                    feed_rss,
+                    feed_all_atom,
+                    feed_all_rss,
+                    category_feed_atom,
+                    category_feed_rss,
+                    author_feed_atom,
+                    author_feed_rss,
+                    tag_feed_atom,
+                    tag_feed_rss,
+                    translation_feed_atom,
+                    translation_feed_rss,
+                )
+            ):
+                return
+
+            # the URL settings below default to their feed path and are
+            # formatted once per category/author/tag/language
+            category_feed_atom_url = self.settings.get(
+                "CATEGORY_FEED_ATOM_URL", category_feed_atom
+            )
+            category_feed_rss_url = self.settings.get(
+                "CATEGORY_FEED_RSS_URL", category_feed_rss
+            )
+            author_feed_atom_url = self.settings.get(
+                "AUTHOR_FEED_ATOM_URL", author_feed_atom
+            )
+            author_feed_rss_url = self.settings.get(
+                "AUTHOR_FEED_RSS_URL", author_feed_rss
+            )
+            tag_feed_atom_url = self.settings.get("TAG_FEED_ATOM_URL", tag_feed_atom)
+            tag_feed_rss_url = self.settings.get("TAG_FEED_RSS_URL", tag_feed_rss)
+            translation_feed_atom_url = self.settings.get(
+                "TRANSLATION_FEED_ATOM_URL", translation_feed_atom
+            )
+            translation_feed_rss_url = self.settings.get(
+                "TRANSLATION_FEED_RSS_URL", translation_feed_rss
+            )
+
+            if feed_atom:
                 writer.write_feed(
                     self.entities,
                     self.context,
-                    self.settings["FEED_ATOM"],
-                    self.settings.get("FEED_ATOM_URL", self.settings["FEED_ATOM"]),
+                    feed_atom,
+                    self.settings.get("FEED_ATOM_URL", feed_atom),
                 )
 
-            if self.settings.get("FEED_RSS"):
+            if feed_rss:
                 writer.write_feed(
                     self.entities,
                     self.context,
-                    self.settings["FEED_RSS"],
-                    self.settings.get("FEED_RSS_URL", self.settings["FEED_RSS"]),
+                    feed_rss,
+                    self.settings.get("FEED_RSS_URL", feed_rss),
                     feed_type="rss",
                 )
 
-            if self.settings.get("FEED_ALL_ATOM") or self.settings.get("FEED_ALL_RSS"):
-                all_entities = list(self.entities)
-                for content in self.entities:
-                    all_entities.extend(content.translations)
-                all_entities.sort(key=attrgetter(*self.sort_attrs), reverse=True)
+            if feed_all_atom or feed_all_rss:
+                all_entities = sorted(
+                    chain(
+                        self.entities,
+                        chain.from_iterable(e.translations for e in self.entities),
+                    ),
+                    key=attrgetter(*self.sort_attrs),
+                    reverse=True,
+                )
 
-                if self.settings.get("FEED_ALL_ATOM"):
+                if feed_all_atom:
                     writer.write_feed(
                         all_entities,
                         self.context,
-                        self.settings["FEED_ALL_ATOM"],
-                        self.settings.get(
-                            "FEED_ALL_ATOM_URL", self.settings["FEED_ALL_ATOM"]
-                        ),
+                        feed_all_atom,
+                        self.settings.get("FEED_ALL_ATOM_URL", feed_all_atom),
                     )
 
-                if self.settings.get("FEED_ALL_RSS"):
+                if feed_all_rss:
                     writer.write_feed(
                         all_entities,
                         self.context,
-                        self.settings["FEED_ALL_RSS"],
-                        self.settings.get(
-                            "FEED_ALL_RSS_URL", self.settings["FEED_ALL_RSS"]
-                        ),
+                        feed_all_rss,
+                        self.settings.get("FEED_ALL_RSS_URL", feed_all_rss),
                         feed_type="rss",
                     )
 
             for cat, entities in self.categories:
-                if self.settings.get("CATEGORY_FEED_ATOM"):
+                if category_feed_atom:
                     writer.write_feed(
                         entities,
                         self.context,
-                        self.settings["CATEGORY_FEED_ATOM"].format(slug=cat.slug),
-                        self.settings.get(
-                            "CATEGORY_FEED_ATOM_URL",
-                            self.settings["CATEGORY_FEED_ATOM"],
-                        ).format(slug=cat.slug),
+                        category_feed_atom.format(slug=cat.slug),
+                        category_feed_atom_url.format(slug=cat.slug),
                         feed_title=cat.name,
                     )
 
-                if self.settings.get("CATEGORY_FEED_RSS"):
+                if category_feed_rss:
                     writer.write_feed(
                         entities,
                         self.context,
-                        self.settings["CATEGORY_FEED_RSS"].format(slug=cat.slug),
-                        self.settings.get(
-                            "CATEGORY_FEED_RSS_URL", self.settings["CATEGORY_FEED_RSS"]
-                        ).format(slug=cat.slug),
+                        category_feed_rss.format(slug=cat.slug),
+                        category_feed_rss_url.format(slug=cat.slug),
                         feed_title=cat.name,
                         feed_type="rss",
                     )
 
             for auth, entities in self.authors:
-                if self.settings.get("AUTHOR_FEED_ATOM"):
+                if author_feed_atom:
                     writer.write_feed(
                         entities,
                         self.context,
-                        self.settings["AUTHOR_FEED_ATOM"].format(slug=auth.slug),
-                        self.settings.get(
-                            "AUTHOR_FEED_ATOM_URL", self.settings["AUTHOR_FEED_ATOM"]
-                        ).format(slug=auth.slug),
+                        author_feed_atom.format(slug=auth.slug),
+                        author_feed_atom_url.format(slug=auth.slug),
                         feed_title=auth.name,
                     )
 
-                if self.settings.get("AUTHOR_FEED_RSS"):
+                if author_feed_rss:
                     writer.write_feed(
                         entities,
                         self.context,
-                        self.settings["AUTHOR_FEED_RSS"].format(slug=auth.slug),
-                        self.settings.get(
-                            "AUTHOR_FEED_RSS_URL", self.settings["AUTHOR_FEED_RSS"]
-                        ).format(slug=auth.slug),
+                        author_feed_rss.format(slug=auth.slug),
+                        author_feed_rss_url.format(slug=auth.slug),
                         feed_title=auth.name,
                         feed_type="rss",
                     )
 
-            if self.settings.get("TAG_FEED_ATOM") or self.settings.get("TAG_FEED_RSS"):
+            if tag_feed_atom or tag_feed_rss:
                 for tag, entities in self.tags.items():
-                    if self.settings.get("TAG_FEED_ATOM"):
+                    if tag_feed_atom:
                         writer.write_feed(
                             entities,
                             self.context,
-                            self.settings["TAG_FEED_ATOM"].format(slug=tag.slug),
-                            self.settings.get(
-                                "TAG_FEED_ATOM_URL", self.settings["TAG_FEED_ATOM"]
-                            ).format(slug=tag.slug),
+                            tag_feed_atom.format(slug=tag.slug),
+                            tag_feed_atom_url.format(slug=tag.slug),
                             feed_title=tag.name,
                         )
 
-                    if self.settings.get("TAG_FEED_RSS"):
+                    if tag_feed_rss:
                         writer.write_feed(
                             entities,
                             self.context,
-                            self.settings["TAG_FEED_RSS"].format(slug=tag.slug),
-                            self.settings.get(
-                                "TAG_FEED_RSS_URL", self.settings["TAG_FEED_RSS"]
-                            ).format(slug=tag.slug),
+                            tag_feed_rss.format(slug=tag.slug),
+                            tag_feed_rss_url.format(slug=tag.slug),
                             feed_title=tag.name,
                             feed_type="rss",
                         )
 
-            if self.settings.get("TRANSLATION_FEED_ATOM") or self.settings.get(
-                "TRANSLATION_FEED_RSS"
-            ):
-                translations_feeds = defaultdict(list)
+            if translation_feed_atom or translation_feed_rss:
+                translations_feeds = {}
                 for entity in chain(self.entities, self.translations):
-                    translations_feeds[content.lang].append(entity)
+                    items = translations_feeds.get(entity.lang)
+                    if items is None:
+                        translations_feeds[entity.lang] = [entity]
+                    else:
+                        items.append(entity)
 
                 for lang, items in translations_feeds.items():
-                    if self.settings.get("TRANSLATION_FEED_ATOM"):
+                    if translation_feed_atom:
                         writer.write_feed(
                             items,
                             self.context,
-                            self.settings["TRANSLATION_FEED_ATOM"].format(lang=lang),
-                            self.settings.get(
-                                "TRANSLATION_FEED_ATOM_URL",
-                                self.settings["TRANSLATION_FEED_ATOM"],
-                            ).format(lang=lang),
+                            translation_feed_atom.format(lang=lang),
+                            translation_feed_atom_url.format(lang=lang),
                         )
-                    if self.settings.get("TRANSLATION_FEED_RSS"):
+                    if translation_feed_rss:
                         writer.write_feed(
                             items,
                             self.context,
-                            self.settings["TRANSLATION_FEED_RSS"].format(lang=lang),
-                            self.settings.get(
-                                "TRANSLATION_FEED_RSS_URL",
-                                self.settings["TRANSLATION_FEED_RSS"],
-                            ).format(lang=lang),
+                            translation_feed_rss.format(lang=lang),
+                            translation_feed_rss_url.format(lang=lang),
                             feed_type="rss",
                         )
 
         def generate_entities(self, write):
             """Generate the entities."""
+            # Resolve the receivers of this signal once rather than having
+            # blinker dereference and filter them again for every entity.
+            # Usually there are none and the inner loop is a no-op.
+            write_entity_receivers = list(
+                entity_subgenerator_write_entity.receivers_for(self)
+            )
+            get_template = self.get_template
+            context = self.context
+            entity_type = self.entity_type
             for entity in chain(
                 self.translations,
                 self.entities,
                 self.hidden_translations,
                 self.hidden_entities,
             ):
-                entity_subgenerator_write_entity.send(self, content=entity)
+                for receiver in write_entity_receivers:
+                    receiver(self, content=entity)
                 write(
                     entity.save_as,
-                    self.get_template(entity.template),
-                    self.context,
+                    get_template(entity.template),
+                    context,
                     url=entity.url,
                     entity=entity,
-                    entity_type=self.entity_type,
+                    entity_type=entity_type,
                     override_output=hasattr(entity, "override_save_as"),
                 )
 
@@ -369,6 +476,9 @@ class EntityGenerator(generators.Generator):
                 "month": self.settings["MONTH_ARCHIVE_SAVE_AS"],
                 "day": self.settings["DAY_ARCHIVE_SAVE_AS"],
             }
+            if not any(period_save_as.values()):
+                # nothing to write, don't bother sorting the entities
+                return
 
             period_url = {
                 "year": self.settings["YEAR_ARCHIVE_URL"],
@@ -382,40 +492,46 @@ class EntityGenerator(generators.Generator):
                 "day": attrgetter("date.year", "date.month", "date.day"),
             }
 
-            def _generate_period_archives(entities, key, save_as_fmt, url_fmt):
-                """Generate period archives from `dates`, grouped by
-                `key` and written to `save_as`.
+            period_depth = {"year": 1, "month": 2, "day": 3}
+            # calendar.month_name formats the name with strftime on every
+            # lookup. Resolve them once here rather than at import time, as
+            # that may happen before Pelican applies the LOCALE setting.
+            month_names = tuple(calendar.month_name)
+
+            def _generate_period_archives(dated, period, save_as_fmt, url_fmt):
+                """Generate period archives from `dated`, grouped by
+                `period` and written to `save_as`.
                 """
-                dates = sorted(
-                    entities,
-                    key=attrgetter("date"),
-                    reverse=self.context["NEWEST_FIRST_ARCHIVES"],
-                )
-                # `dates` is already sorted by date
-                for _period, group in groupby(dates, key=key):
-                    archive = list(group)
+                key = period_date_key[period]
+                depth = period_depth[period]
+                # `dated` is already sorted by date
+                for _period, group in groupby(dated, key=lambda d: d[0][:depth]):
+                    archive = [entity for _date, entity in group]
                     # arbitrarily grab the first date so that the usual
                     # format string syntax can be used for specifying the
                     # period archive dates
                     date = archive[0].date
                     save_as = save_as_fmt.format(date=date)
                     url = url_fmt.format(date=date)
-                    context = self.context.copy()
-
-                    if key == period_date_key["year"]:
-                        context["period"] = (_period,)
-                        context["period_num"] = (_period,)
+                    # the writer renders from its own copy of the context,
+                    # so pass the period along with the other template
+                    # variables rather than copying the whole context here
+                    if period == "year":
+                        period_context = {"period": _period, "period_num": _period}
                     else:
-                        month_name = calendar.month_name[_period[1]]
-                        if key == period_date_key["month"]:
-                            context["period"] = (_period[0], month_name)
+                        month_name = month_names[_period[1]]
+                        if period == "month":
+                            period_context = {"period": (_period[0], month_name)}
                         else:
-                            context["period"] = (_period[0], month_name, _period[2])
+                            period_context = {
+                                "period": (_period[0], month_name, _period[2])
+                            }
 
                     write(
                         save_as,
                         template,
-                        context,
+                        self.context,
+                        **period_context,
                         key=key,
                         url=url,
                         template_name=template_name,
@@ -423,12 +539,23 @@ class EntityGenerator(generators.Generator):
                         entity_type=self.entity_type,
                     )
 
+            # Sort once and pair each entity with its (year, month, day): all
+            # three periods are monotonic in the date, so they can be grouped
+            # off the same ordering.
+            dated = [
+                ((entity.date.year, entity.date.month, entity.date.day), entity)
+                for entity in sorted(
+                    self.entities,
+                    key=attrgetter("date"),
+                    reverse=self.context["NEWEST_FIRST_ARCHIVES"],
+                )
+            ]
+
             for period in "year", "month", "day":
                 save_as = period_save_as[period]
                 url = period_url[period]
                 if save_as:
-                    key = period_date_key[period]
-                    _generate_period_archives(self.entities, key, save_as, url)
+                    _generate_period_archives(dated, period, save_as, url)
 
         def generate_direct_templates(self, write):
             """Generate direct templates pages"""
@@ -566,19 +693,17 @@ class EntityGenerator(generators.Generator):
         def generate_context(self):
             """Add the entities into the shared context"""
 
-            all_entities = []
-            all_drafts = []
-            hidden_entities = []
+            entities_by_status = {"published": [], "draft": [], "hidden": []}
+            entity_class = EntityFactory(
+                self.entity_type,
+                self.settings["MANDATORY_PROPERTIES"],
+                self.settings["DEFAULT_TEMPLATE"],
+            )
             for f in self.get_files(
                 self.settings["PATHS"], exclude=self.settings["EXCLUDES"]
             ):
                 entity = self.get_cached_data(f, None)
                 if entity is None:
-                    entity_class = EntityFactory(
-                        self.entity_type,
-                        self.settings["MANDATORY_PROPERTIES"],
-                        self.settings["DEFAULT_TEMPLATE"],
-                    )
                     try:
                         entity = self.readers.read_file(
                             base_path=self.path,
@@ -606,13 +731,9 @@ class EntityGenerator(generators.Generator):
 
                     self.cache_data(f, entity)
 
-                if entity.status == "published":
-                    all_entities.append(entity)
-                elif entity.status == "draft":
-                    all_drafts.append(entity)
-                elif entity.status == "hidden":
-                    hidden_entities.append(entity)
-                else:
+                try:
+                    entities_by_status[entity.status].append(entity)
+                except KeyError:
                     logger.warning(
                         "Unknown status '%s' for file %s, skipping it.",
                         entity.status,
@@ -625,37 +746,63 @@ class EntityGenerator(generators.Generator):
             sorter = self.settings["SORTER"]
 
             def _process(entities):
+                if not entities:
+                    # most sites have no hidden entities and/or drafts
+                    return [], []
                 origs, translations = process_translations(
                     entities, translation_id=self.settings["ARTICLE_TRANSLATION_ID"]
                 )
                 sorter(origs)
                 return origs, translations
 
-            self.entities, self.translations = _process(all_entities)
-            self.hidden_entities, self.hidden_translations = _process(hidden_entities)
-            self.drafts, self.drafts_translations = _process(all_drafts)
+            self.entities, self.translations = _process(entities_by_status["published"])
+            self.hidden_entities, self.hidden_translations = _process(
+                entities_by_status["hidden"]
+            )
+            self.drafts, self.drafts_translations = _process(
+                entities_by_status["draft"]
+            )
 
             entity_subgenerator_pretaxonomy.send(self)
 
+            categories = self.categories
+            tags = self.tags
+            authors = self.authors
+            # Every entity has its own category/tag/author instances. Key the
+            # maps by the first instance seen for each name so that lookups
+            # succeed on the identity check rather than calling
+            # URLWrapper.__eq__.
+            category_by_name = {}
+            tag_by_name = {}
+            author_by_name = {}
             for entity in self.entities:
                 # only main entities are listed in categories and tags
                 # not translations
-                if hasattr(entity, "category"):
-                    self.categories[entity.category].append(entity)
-                if hasattr(entity, "tags"):
-                    for tag in entity.tags:
-                        self.tags[tag].append(entity)
-                for author in getattr(entity, "authors", []):
-                    self.authors[author].append(entity)
+                category = getattr(entity, "category", None)
+                if category is not None:
+                    category = category_by_name.setdefault(category.name, category)
+                    categories.setdefault(category, []).append(entity)
+                for tag in getattr(entity, "tags", ()):
+                    tag = tag_by_name.setdefault(tag.name, tag)
+                    tags.setdefault(tag, []).append(entity)
+                for author in getattr(entity, "authors", ()):
+                    author = author_by_name.setdefault(author.name, author)
+                    authors.setdefault(author, []).append(entity)
 
             # and generate the output :)
 
-            # order the categories per name
+            # order the categories per name. URLWrappers compare by slug, so
+            # sort on the slug strings directly rather than on the (wrapper,
+            # entities) tuples, which costs a couple of Python-level
+            # __eq__/__lt__ calls per comparison.
             self.categories = list(self.categories.items())
-            self.categories.sort(reverse=self.settings["REVERSE_CATEGORY_ORDER"])
+            self.categories.sort(
+                key=lambda item: item[0].slug,
+                reverse=self.settings["REVERSE_CATEGORY_ORDER"],
+            )
 
             self.authors = list(self.authors.items())
-            self.authors.sort()
+            self.authors.sort(key=lambda item: item[0].slug)
 
             self.save_cache()
             self.readers.save_cache()
@@ -675,12 +822,31 @@ class EntityGenerator(generators.Generator):
                 self.hidden_entities,
                 self.hidden_translations,
             ):
-                if hasattr(e, "refresh_metadata_intersite_links"):
-                    e.refresh_metadata_intersite_links()
+                refresh = getattr(e, "refresh_metadata_intersite_links", None)
+                if refresh is not None:
+                    refresh()
 
         class SubGeneratorContext:
+            # Slots for the attributes set by get_context(), which templates
+            # read over and over; "__dict__" keeps room for extra attributes
+            # set by subclasses or plugins.
+            __slots__ = (
+                "type",
+                "entities",
+                "translations",
+                "drafts",
+                "drafts_translations",
+                "hidden_entities",
+                "hidden_translations",
+                "tags",
+                "categories",
+                "authors",
+                "__dict__",
+            )
+
             def __init__(self, **kwds):
-                self.__dict__.update(kwds)
+                for key, value in kwds.items():
+                    setattr(self, key, value)
 
         def get_context(self):
             context = self.SubGeneratorContext()
@@ -707,11 +873,8 @@ class EntityGenerator(generators.Generator):
         entity_types_settings = self.settings["ENTITY_TYPES"]
 
         for entity_type, custom_entity_type_settings in entity_types_settings.items():
-            logger.debug("Found entity type: %s" % entity_type)
-            entity_type_settings = get_default_entity_type_settings(entity_type)
-            entity_type_settings.update(custom_entity_type_settings)
-
-            entity_type_settings = copy.copy(self.settings)
+            logger.debug("Found entity type: %s", entity_type)
+            entity_type_settings = self.settings.copy()
             entity_type_settings.update(get_default_entity_type_settings(entity_type))
             entity_type_settings.update(custom_entity_type_settings)
 
@@ -735,28 +898,52 @@ class EntityGenerator(generators.Generator):
 
         for entity_type, generator in self.entity_types.items():
             logger.debug(
-                "Generating context for entities of type {0}".format(
-                    generator.entity_type
-                )
+                "Generating context for entities of type %s", generator.entity_type
             )
             generator.generate_context()
             setattr(self, entity_type.lower(), generator.get_context())
             context_update_fields.append(entity_type.lower())
 
-            self.entities += generator.entities
+            self.entities.extend(generator.entities)
 
-        logger.debug("Context update fields: %s" % str(context_update_fields))
+        logger.debug("Context update fields: %s", context_update_fields)
 
         self._update_context(context_update_fields)
         entity_generator_finalized.send(self)
 
     def generate_output(self, writer):
-        for generator in self.entity_types.values():
+        def _generate_output(generator, writer):
             logger.debug(
-                "Generating output for entities of type {0}".format(
-                    generator.entity_type
-                )
+                "Generating output for entities of type %s", generator.entity_type
             )
             generator.generate_output(writer)
 
+        skip_output_types = self.settings.get("ENTITY_SKIP_OUTPUT_TYPES", ())
+        generators = [
+            generator
+            for entity_type, generator in self.entity_types.items()
+            if entity_type not in skip_output_types
+        ]
+        workers = min(self.settings.get("ENTITY_OUTPUT_WORKERS", 1), len(generators))
+        if workers > 1 and self.settings["RELATIVE_URLS"]:
+            # The writer stores the relative site URL of the page being
+            # rendered in the shared context, so renders can't overlap.
+            logger.warning("ENTITY_OUTPUT_WORKERS is ignored with RELATIVE_URLS")
+            workers = 1
+
+        if workers > 1:
+            # Subgenerators temporarily swap the writer settings and feeds
+            # keep per-feed state on the writer, so give each of them a
+            # shallow copy (which still shares the set of written files).
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_generate_output, generator, copy.copy(writer))
+                    for generator in generators
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for generator in generators:
+                _generate_output(generator, writer)
+
         entity_writer_finalized.send(self, writer=writer)